@@ -87,74 +87,121 @@ __copyright__ = "Copyright 2023, Fribourg Switzerland"
 import os
 import sys
 
-from PyLTSpice.log.ltsteps import *
 import logging
 _logger = logging.getLogger("PyLTSpice.LTSteps")
 
 
+# Names of PyLTSpice.log.ltsteps that are made available by this module. The log reader is only imported when one of
+# them is first used, which keeps the startup of the command line tool short.
+_LAZY_NAMES = ('LTSpiceLogReader', 'LTSpiceExport', 'reformat_LTSpice_export', 'LogfileData')
+
+__all__ = ['main', 'valid_extension', 'find_newest_file', *_LAZY_NAMES]
+
+
+def __getattr__(name):
+    """Imports the names of the log reader on their first use"""
+    if name in _LAZY_NAMES:
+        from PyLTSpice.log import ltsteps
+        return getattr(ltsteps, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """Lists the names of the log reader, which are not in the module namespace until they are used"""
+    return sorted(list(globals()) + list(_LAZY_NAMES))
+
+
+def valid_extension(filename):
+    """A simple function to check if the filename has a valid extension"""
+    return filename.endswith(('.txt', '.log', '.mout'))
+
+
+def find_newest_file():
+    """
+    Returns the name of the newest .txt, .log or .mout file on the current working directory, or None if no such file
+    exists.
+
+    :return: filename of the newest file
+    :rtype: str or None
+    """
+    filename = None
+    newer_date = 0
+    # scandir() returns the file type together with the directory listing (and on Windows also the stat
+    # information), so only the files with a valid extension need to be stat'ed.
+    with os.scandir('.') as it:
+        for entry in it:
+            if entry.is_file() and valid_extension(entry.name):
+                date = entry.stat().st_mtime
+                if date > newer_date:
+                    newer_date = date
+                    filename = entry.name
+    return filename
+
+
+def _process_txt(filename: str, fname_out: str):
+    """Reformats a file exported with the "Export data as text" menu"""
+    from PyLTSpice.log.ltsteps import reformat_LTSpice_export
+    _logger.debug("Processing Data File")
+    reformat_LTSpice_export(filename, fname_out)
+
+
+def _process_log(filename: str, fname_out: str):
+    """Exports the steps and measurements of a log file"""
+    from PyLTSpice.log.ltsteps import LTSpiceLogReader
+    data = LTSpiceLogReader(filename)
+    data.split_complex_values_on_datasets()
+    data.export_data(fname_out)
+
+
+def _process_mout(filename: str, fname_out: str):
+    """Exports the measurements of a .mout file, adding the step information of its .log file if it exists"""
+    from PyLTSpice.log.ltsteps import LTSpiceLogReader
+    log_file = os.path.splitext(filename)[0] + '.log'
+    if os.path.exists(log_file):
+        steps = LTSpiceLogReader(log_file, read_measures=False)
+        data = LTSpiceLogReader(filename)
+        data.stepset = steps.stepset
+        data.step_count = steps.step_count
+    else:
+        # just reformats
+        data = LTSpiceLogReader(filename)
+    data.split_complex_values_on_datasets()
+    data.export_data(fname_out)
+
+
+# For each supported file extension, the function that processes it and the extension of the file it creates
+_PROCESSORS = {
+    '.txt': (_process_txt, '.tsv'),
+    '.log': (_process_log, '.tlog'),
+    '.mout': (_process_mout, '.tmout'),
+}
+
+
 def main():
     """
     Main function for the LTSteps.py script
     """
-    def valid_extension(filename):
-        """A simple function to check if the filename has a valid extension"""
-        return filename.endswith('.txt') or filename.endswith('.log') or filename.endswith('.mout')
-
     if len(sys.argv) > 1:
         filename = sys.argv[1]
         print("Using filename:", filename)
     else:
-        filename = None
-        newer_date = 0
-        for f in os.listdir():
-            date = os.path.getmtime(f)
-            if date > newer_date and valid_extension(f):
-                newer_date = date
-                filename = f
+        filename = find_newest_file()
 
     if filename is None:
         print("File not found")
         print("This tool only supports the following extensions :'.txt','.log','.mout'")
         exit(-1)
-        
-    if not valid_extension(filename):
-        print("Invalid extension in filename '%s'" % filename)
-        print("This tool only supports the following extensions :'.txt','.log','.mout'")
-        exit(-1)
 
-    fname_out = None
-    if filename.endswith('.txt'):
-        fname_out = filename[:-len('txt')] + 'tsv'
-    elif filename.endswith('.log'):
-        fname_out = filename[:-len('log')] + 'tlog'
-    elif filename.endswith('.mout'):
-        fname_out = filename[:-len('mout')] + 'tmout'
-    else:
-        print("Error in file type")
+    root, ext = os.path.splitext(filename)
+    if ext not in _PROCESSORS:
+        print("Invalid extension in filename '%s'" % filename)
         print("This tool only supports the following extensions :'.txt','.log','.mout'")
         exit(-1)
 
-    if fname_out is not None:
-        print("Creating File %s" % fname_out)
-        if filename.endswith('txt'):
-            _logger.debug("Processing Data File")
-            reformat_LTSpice_export(filename, fname_out)
-        elif filename.endswith("log"):
-            data = LTSpiceLogReader(filename)
-            data.split_complex_values_on_datasets()
-            data.export_data(fname_out)
-        elif filename.endswith(".mout"):
-            log_file = filename[:len('mout')] + 'log'
-            if os.path.exists(log_file):
-                steps = LTSpiceLogReader(log_file, read_measures=False)
-                data = LTSpiceLogReader(filename, step_set=steps.stepset)
-                data.stepset = steps.stepset
-            else:
-                # just reformats
-                data = LTSpiceLogReader(filename)
-            data.split_complex_values_on_datasets()
-            data.export_data(fname_out)
-            data.export_data(fname_out)
+    processor, out_ext = _PROCESSORS[ext]
+    fname_out = root + out_ext
+    print("Creating File %s" % fname_out)
+    processor(filename, fname_out)
 
 
 if __name__ == "__main__":
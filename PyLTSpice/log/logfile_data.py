@@ -10,6 +10,7 @@
 # Licence:     refer to the LICENSE file
 # -------------------------------------------------------------------------------
 
+import csv
 import re
 from typing import Union, Iterable, List
 from collections import OrderedDict
@@ -87,6 +88,36 @@ def try_convert_values(values: Iterable[str]) -> List[Union[int, float, str]]:
     return answer
 
 
+def try_convert_column(values: List[str]) -> List[Union[int, float, str]]:
+    """
+    Same as try_convert_values but optimized for a column of data, where normally all values have the same type. The
+    column is converted at once using numpy, and only if that fails, the values are converted one by one.
+    The result is the same as try_convert_values, including the values written as integers being kept as int.
+
+    :param values: list of strings
+    :type values: List[str]
+    :return: list with the values converted to either integer (int) or floating point (float)
+    :rtype: list
+    """
+    import numpy as np
+    try:
+        return np.array(values, dtype=np.int64).tolist()
+    except (ValueError, OverflowError):
+        pass
+    try:
+        floats = np.array(values, dtype=np.float64)
+    except (ValueError, OverflowError):
+        return try_convert_values(values)
+    answer = floats.tolist()
+    # Only values with no fractional part can have been written as integers
+    for i in np.flatnonzero(floats == np.floor(floats)):
+        try:
+            answer[i] = int(values[i])
+        except ValueError:
+            pass
+    return answer
+
+
 class LogfileData:
     """
     This is a subclass of LTSpiceLogReader that is used to analyse the log file of a simulation.
@@ -294,35 +325,48 @@ class LogfileData:
         if encoding is None:
             encoding = self.encoding if hasattr(self, 'encoding') else 'utf-8'
 
-        fout = open(export_file, mode, encoding=encoding)
+        columns = self._export_columns()  # Checked before the file is opened, so that no truncated file is written
+        with open(export_file, mode, encoding=encoding, buffering=1 << 20) as fout:
+            writer = csv.writer(fout, delimiter='\t', lineterminator='\n')
+            header = ['step'] + list(self.stepset.keys()) + list(self.dataset.keys())
+            if append_with_line_prefix is not None:  # if appending a file, it must write the column title
+                header.insert(0, 'user info')
+            writer.writerow(header)
+            writer.writerows(self._export_rows(columns, append_with_line_prefix))
 
-        if append_with_line_prefix is not None:  # if appending a file, it must write the column title
-            fout.write('user info\t')
-
-        fout.write("step\t%s\t%s\n" % ("\t".join(self.stepset.keys()), "\t".join(self.dataset)))
-        first_parameter = next(iter(self.dataset))
-        for index in range(len(self.dataset[first_parameter])):
-            if self.step_count == 0:
-                step_data = []  # Empty step
-            else:
-                step_data = [self.stepset[param][index] for param in self.stepset.keys()]
-            meas_data = [self.dataset[param][index] for param in self.dataset]
-
-            if append_with_line_prefix is not None:  # if appending a file it must write the user info
-                fout.write(append_with_line_prefix + '\t')
-            fout.write("%d" % (index + 1))
-            for s in step_data:
-                fout.write(f'\t{s}')
-
-            for tok in meas_data:
+    def _export_columns(self) -> list:
+        """
+        Returns the columns written by export_data(), the step values followed by the measurement values. The number of
+        rows is the number of values of the first measurement. A column with fewer values raises an IndexError, and the
+        values of a column that has more are not exported.
+        """
+        if self.step_count == 0:
+            columns = []  # Empty step
+        else:
+            columns = list(self.stepset.items())
+        columns += self.dataset.items()
+        row_count = len(next(iter(self.dataset.values())))
+        for name, values in columns:
+            if len(values) < row_count:
+                raise IndexError("'%s' has %d values, but the data has %d rows" % (name, len(values), row_count))
+            if len(values) > row_count:
+                _logger.warning("'%s' has %d values, only the first %d are exported" % (name, len(values), row_count))
+        return [values for name, values in columns]
+
+    def _export_rows(self, columns: list, line_prefix=None):
+        """
+        Generator of the rows written by export_data(). Each row contains the step number, the step values and the
+        measurement values. Measurements that are lists are expanded into several columns.
+        """
+        prefix = [] if line_prefix is None else [line_prefix]  # if appending a file it must write the user info
+        for index, values in enumerate(zip(*columns), start=1):
+            row = prefix + [index]
+            for tok in values:
                 if isinstance(tok, list):
-                    for x in tok:
-                        fout.write(f'\t{x}')
+                    row.extend(tok)
                 else:
-                    fout.write(f'\t{tok}')
-            fout.write('\n')
-
-        fout.close()
+                    row.append(tok)
+            yield row
 
     def plot_histogram(self, param, steps: Union[None, int, Iterable] = None, bins=50, normalized=True, sigma=3.0, title=None, image_file=None, **kwargs):
         """
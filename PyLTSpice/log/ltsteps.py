@@ -80,11 +80,64 @@ __copyright__ = "Copyright 2023, Fribourg Switzerland"
 
 
 import re
-from .logfile_data import LogfileData, try_convert_value, try_convert_values
+from .logfile_data import LogfileData, try_convert_value, try_convert_column
 from ..utils.detect_encoding import detect_encoding
 import logging
 _logger = logging.getLogger("PyLTSpice.LTSteps")
 
+REFORMAT_BLOCK_LINES = 1 << 14  #: Maximum number of lines that reformat_LTSpice_export() holds before writing them
+
+STEP_INFO_REGEX = re.compile(r"Step Information: ([\w=\d\. -]+) +\(Run: (\d*)/\d*\)\n")
+
+# Stepless measurement read regular expression
+# there are only measures taken in the format parameter: measurement
+# A few examples of readings
+# vout_rms: RMS(v(out))=1.41109 FROM 0 TO 0.001  => Interval
+# vin_rms: RMS(v(in))=0.70622 FROM 0 TO 0.001  => Interval
+# gain: vout_rms/vin_rms=1.99809 => Parameter
+# vout1m: v(out)=-0.0186257 at 0.001 => Point
+# fcutac=8.18166e+006 FROM 1.81834e+006 TO 1e+007 => AC Find Computation
+MEASURE_REGEX = re.compile(
+        r"^(?P<name>\w+)(:\s+.*)?=(?P<value>[\d\.E+\-\(\)dB,°]+)(( FROM (?P<from>[\d\.E+-]*) TO (?P<to>[\d\.E+-]*))|( at (?P<at>[\d\.E+-]*)))?",
+        re.IGNORECASE)
+
+
+def _read_measurement_rows(lines, columns: list):
+    """
+    Reads the rows of a measurement table that follow its header, that is, the lines that start with the step number.
+    The values are appended to the columns lists, one per column after the step number.
+    The rows are transposed only once at the end of the table, which is much faster than appending the values one by
+    one.
+
+    :param lines: iterator on the lines of the file, normally the text mode file object
+    :param columns: list of lists where the values are to be appended
+    :return: the number of rows read and the first line that isn't a measurement row, or '' if the file ended.
+    :rtype: tuple
+    :raises IndexError: if a row has fewer values than there are columns
+    """
+    rows = []
+    row_length = len(columns) + 1  # The step number and the values
+    line = ''
+    for line in lines:
+        tokens = line.rstrip('\r\n').split('\t')
+        if len(tokens) < 2:
+            break
+        try:
+            int(tokens[0])  # This instruction only serves to trigger the exception
+        except ValueError:
+            break
+        if len(tokens) < row_length:
+            # The rows are transposed with zip(), which would cut all the columns to the length of the shortest row
+            raise IndexError("Measurement row '%s' has %d values, %d were expected" %
+                             (line.rstrip('\r\n'), len(tokens) - 1, len(columns)))
+        rows.append(tokens)
+    else:
+        line = ''  # End of file
+    transposed = zip(*rows)
+    next(transposed, None)  # Skips the step number column
+    for column, values in zip(columns, transposed):
+        column.extend(values)
+    return len(rows), line
 
 
 def reformat_LTSpice_export(export_file: str, tabular_file: str):
@@ -121,10 +174,18 @@ def reformat_LTSpice_export(export_file: str, tabular_file: str):
     go_header = True
     run_no = 0  # Just to avoid warning, this is later overridden by the step information
     param_values = ""  # Just to avoid warning, this is later overridden by the step information
-    regx = re.compile(r"Step Information: ([\w=\d\. -]+) +\(Run: (\d*)/\d*\)\n")
+    block = []  # Lines of the current step. They are written at once, since they all share the same prefix.
+
+    def write_block():
+        if block:
+            prefix = "%s\t%s\t" % (run_no, param_values)
+            fout.write(prefix + prefix.join(block))
+            block.clear()
+
     for line in fin:
         if line.startswith("Step Information:"):
-            match = regx.match(line)
+            write_block()
+            match = STEP_INFO_REGEX.match(line)
             # print(line, end="")
             if match:
                 # print(match.groups())
@@ -146,8 +207,11 @@ def reformat_LTSpice_export(export_file: str, tabular_file: str):
                     go_header = False
                     # print("%s\t%s"% (run_no, param_values))
         else:
-            fout.write("%s\t%s\t%s" % (run_no, param_values, line))
+            block.append(line)
+            if len(block) >= REFORMAT_BLOCK_LINES:
+                write_block()
 
+    write_block()
     fin.close()
     fout.close()
 
@@ -186,10 +250,9 @@ class LTSpiceExport(object):
         curr_dic = {}
         self.dataset = {}
 
-        regx = re.compile(r"Step Information: ([\w=\d\. -]+) +\(Run: (\d*)/\d*\)\n")
         for line in fin:
             if line.startswith("Step Information:"):
-                match = regx.match(line)
+                match = STEP_INFO_REGEX.match(line)
                 # print(line, end="")
                 if match:
                     # print(match.groups())
@@ -251,23 +314,17 @@ class LTSpiceLogReader(LogfileData):
         super().__init__(step_set)
         self.logname = log_filename
         if encoding is None:
-            self.encoding = detect_encoding(log_filename, "Circuit:")
+            if log_filename.endswith('.mout'):
+                # The .mout files created by the "Execute .MEAS Script" menu don't have the circuit header of the log
+                # files. They start with "Measurement:" on stepped simulations, and otherwise with the first measurement.
+                self.encoding = detect_encoding(log_filename)
+            else:
+                self.encoding = detect_encoding(log_filename, "Circuit:")
         else:
             self.encoding = encoding
 
-        # Preparing a stepless measurement read regular expression
-        # there are only measures taken in the format parameter: measurement
-        # A few examples of readings
-        # vout_rms: RMS(v(out))=1.41109 FROM 0 TO 0.001  => Interval
-        # vin_rms: RMS(v(in))=0.70622 FROM 0 TO 0.001  => Interval
-        # gain: vout_rms/vin_rms=1.99809 => Parameter
-        # vout1m: v(out)=-0.0186257 at 0.001 => Point
-        # fcutac=8.18166e+006 FROM 1.81834e+006 TO 1e+007 => AC Find Computation
-        regx = re.compile(
-                r"^(?P<name>\w+)(:\s+.*)?=(?P<value>[\d\.E+\-\(\)dB,°]+)(( FROM (?P<from>[\d\.E+-]*) TO (?P<to>[\d\.E+-]*))|( at (?P<at>[\d\.E+-]*)))?",
-                re.IGNORECASE)
-
         _logger.debug(f"Processing LOG file:{log_filename}")
+        step_values = {}  # Cache of the step values already converted
         with open(log_filename, 'r', encoding=self.encoding) as fin:
             line = fin.readline()
 
@@ -354,8 +411,12 @@ class LTSpiceLogReader(LogfileData):
                     tokens = line.strip('\r\n').split(' ')
                     for tok in tokens[1:]:
                         lhs, rhs = tok.split("=")
-                        # Try to convert to int or float
-                        rhs = try_convert_value(rhs)
+                        # Try to convert to int or float. The same values repeat on many steps, so the converted
+                        # value is only computed once, and all the steps share the same object.
+                        value = step_values.get(rhs)
+                        if value is None:
+                            value = step_values[rhs] = try_convert_value(rhs)
+                        rhs = value
 
                         ll = self.stepset.get(lhs, None)
                         if ll:
@@ -371,7 +432,8 @@ class LTSpiceLogReader(LogfileData):
                         break  # Jumps to the section that reads measurements
 
                 if self.step_count == 0:  # then there are no steps,
-                    match = regx.match(line)
+                    # A measurement always has an '=' sign, which is much faster to check than the regular expression
+                    match = MEASURE_REGEX.match(line) if '=' in line else None
                     if match:
                         # Get the data
                         dataname = match.group('name')
@@ -394,19 +456,21 @@ class LTSpiceLogReader(LogfileData):
             dataname = None
 
             headers = []  # Initializing an empty parameters
-            measurements = []
+            columns = []  # One list per header, so that the measurements don't need to be transposed when stored
+            row_count = 0
             while line:
                 line = line.strip('\r\n')
                 if line.startswith("Measurement: "):
                     if dataname:  # If previous measurement was saved
                         # store the info
-                        if len(measurements):
-                            _logger.debug("Storing Measurement %s (count %d)" % (dataname, len(measurements)))
-                            self.measure_count += len(measurements)
-                            for k, title in enumerate(headers):
-                                self.dataset[title] = [line[k] for line in measurements]
+                        if row_count:
+                            _logger.debug("Storing Measurement %s (count %d)" % (dataname, row_count))
+                            self.measure_count += row_count
+                            for title, column in zip(headers, columns):
+                                self.dataset[title] = try_convert_column(column)
                         headers = []
-                        measurements = []
+                        columns = []
+                        row_count = 0
                     dataname = line[13:]  # text which is after "Measurement: ". len("Measurement: ") -> 13
                     _logger.debug("Reading Measurement %s" % line[13:])
                 else:
@@ -414,8 +478,10 @@ class LTSpiceLogReader(LogfileData):
                     if len(tokens) >= 2:
                         try:
                             int(tokens[0])  # This instruction only serves to trigger the exception
-                            meas = tokens[1:]  # [float(x) for x in tokens[1:]]
-                            measurements.append(try_convert_values(meas))
+                            # The values are converted column by column when the measurement is stored
+                            for column, value in zip(columns, tokens[1:]):
+                                column.append(value)
+                            row_count += 1
                             self.measure_count += 1
                         except ValueError:
                             if len(tokens) >= 3 and (tokens[2] == "FROM" or tokens[2] == 'at'):
@@ -423,7 +489,10 @@ class LTSpiceLogReader(LogfileData):
                             if len(tokens) >= 4 and tokens[3] == "TO":
                                 tokens[3] = dataname + "_TO"
                             headers = [dataname] + tokens[2:]
-                            measurements = []
+                            columns = [[] for _ in headers]
+                            row_count, line = _read_measurement_rows(fin, columns)
+                            self.measure_count += row_count
+                            continue  # The returned line is not a measurement row and still needs to be processed
                     else:
                         _logger.debug("->" + line)
 
@@ -431,11 +500,11 @@ class LTSpiceLogReader(LogfileData):
 
             # storing the last data into the dataset
             if dataname:
-                _logger.debug("Storing Measurement %s (count %d)" % (dataname, len(measurements)))
-            if len(measurements):
-                self.measure_count += len(measurements)
-                for k, title in enumerate(headers):
-                    self.dataset[title] = [line[k] for line in measurements]
+                _logger.debug("Storing Measurement %s (count %d)" % (dataname, row_count))
+            if row_count:
+                self.measure_count += row_count
+                for title, column in zip(headers, columns):
+                    self.dataset[title] = try_convert_column(column)
 
             _logger.debug("%d measurements" % len(self.dataset))
             _logger.info("Identified %d steps, read %d measurements" % (self.step_count, self.measure_count))
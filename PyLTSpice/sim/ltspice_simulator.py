@@ -28,36 +28,30 @@ _logger = logging.getLogger("PyLTSpice.LTSpiceSimulator")
 from .simulator import Simulator, run_function
 
 
-class LTspice(Simulator):
-    """Stores the simulator location and command line options and is responsible for generating netlists and running
-    simulations."""
-
-    """Searches on the any usual locations for a simulator"""
-    if sys.platform == "linux":
-        spice_folder = os.environ.get("LTSPICEFOLDER")
-        spice_executable = os.environ.get("LTSPICEEXECUTABLE")
-
-        if spice_folder and spice_executable:
-            spice_exe = ["wine", os.path.join(spice_folder, spice_executable)]
-            process_name = spice_executable
-        elif spice_folder:
-            spice_exe = ["wine", os.path.join(spice_folder, "/XVIIx64.exe")]
-            process_name = "XVIIx64.exe"
-        elif spice_executable:
-            default_folder = os.path.expanduser(
-                "~/.wine/drive_c/Program Files/LTC/LTspiceXVII"
-            )
-            spice_exe = ["wine", os.path.join(default_folder, spice_executable)]
-            process_name = spice_executable
-        else:
-            default_folder = os.path.expanduser(
-                "~/.wine/drive_c/Program Files/LTC/LTspiceXVII"
-            )
-            spice_exe = ["wine", os.path.join(default_folder, "XVIIx64.exe")]
-            process_name = "XVIIx64.exe"
-    elif sys.platform == "darwin":
-        spice_exe = ['/Applications/LTspice.app/Contents/MacOS/LTspice']
-        process_name = "XVIIx64"
+def _discover_exe(platform: str) -> (list, str):
+    """
+    Searches the usual locations for a simulator. The LTSPICEFOLDER and LTSPICEEXECUTABLE environment variables
+    can be used to override the location of the simulator.
+    The name of the process is derived from the executable in the same way as Simulator.create_from() does, so that it
+    is the same whether the location is found or set by the environment variables.
+
+    :param platform: the value of sys.platform
+    :type platform: str
+    :return: the command line to call the simulator and the name of its process
+    :rtype: tuple
+    """
+    spice_folder = os.environ.get("LTSPICEFOLDER")
+    spice_executable = os.environ.get("LTSPICEEXECUTABLE")
+
+    if platform == "linux":
+        if not spice_folder:
+            spice_folder = os.path.expanduser("~/.wine/drive_c/Program Files/LTC/LTspiceXVII")
+        spice_exe = ["wine", os.path.join(spice_folder, spice_executable or "XVIIx64.exe")]
+    elif platform == "darwin":
+        spice_exe = [os.path.join(spice_folder or '/Applications/LTspice.app/Contents/MacOS',
+                                  spice_executable or 'LTspice')]
+    elif spice_folder or spice_executable:  # Windows
+        spice_exe = [os.path.join(spice_folder or r"C:\Program Files\ADI\LTspice", spice_executable or "LTspice.exe")]
     else:  # Windows
         for exe in (  # Placed in order of preference. The first to be found will be used.
                 os.path.expanduser(r"~\AppData\Local\Programs\ADI\LTspice\LTspice.exe"),
@@ -70,14 +64,23 @@ class LTspice(Simulator):
                 spice_exe = [exe]
                 break
         else:
-            spice_exe = []
             _logger.error("================== ALERT! ====================")
             _logger.error("Unable to find a LTSpice executable.")
             _logger.error("A specific location of the LTSPICE can be set")
             _logger.error("using the create_from(<location>) class method")
             _logger.error("==============================================")
+            return [], "XVIIx64.exe"
+
+    exe_path = Path(spice_exe[-1])
+    process_name = exe_path.stem if platform == "darwin" else exe_path.name
+    return spice_exe, process_name
+
+
+class LTspice(Simulator):
+    """Stores the simulator location and command line options and is responsible for generating netlists and running
+    simulations."""
 
-        process_name = "XVIIx64.exe"
+    spice_exe, process_name = _discover_exe(sys.platform)
 
     ltspice_args = {
         'alt' : ['-alt'],  # Set solver to Alternate.
@@ -109,6 +112,9 @@ class LTspice(Simulator):
         'uninstall' : ['-uninstall'],  # Please don't. Executes one step of the uninstallation process.
 
     }
+    # Switches that have a <path> placeholder. This is computed only once, when the class is created.
+    _path_switches = frozenset(name for name, switches in ltspice_args.items()
+                               if any('<path>' in sw for sw in switches))
 
     @classmethod
     def valid_switch(cls, switch, path='') -> list:
@@ -158,7 +164,10 @@ class LTspice(Simulator):
         """
         if switch in cls.ltspice_args:
             switches = cls.ltspice_args[switch]
-            switches = [switch.replace('<path>', path) for switch in switches]
+            if switch in cls._path_switches:
+                switches = [switch.replace('<path>', path) for switch in switches]
+            else:
+                switches = list(switches)  # A copy, so that the class dictionary isn't modified by the caller
             return switches
         else:
             raise ValueError("Invalid switch for class ")
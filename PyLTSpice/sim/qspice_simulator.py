@@ -68,6 +68,9 @@ class Qspice(Simulator):
         'ProtectSubcircuits': ['-ProtectSubcircuits', '<path>'],  # Protect the body of subcircuits with encryption.
         'r'       : ['-r', '<path>'],  # Specify the name of the output data(.qraw) file.
     }
+    # Switches that have a <path> placeholder. This is computed only once, when the class is created.
+    _path_switches = frozenset(name for name, switches in qspice_args.items()
+                               if any('<path>' in sw for sw in switches))
 
     @classmethod
     def valid_switch(cls, switch, path='') -> list:
@@ -100,7 +103,10 @@ class Qspice(Simulator):
         """
         if switch in cls.qspice_args:
             switches = cls.qspice_args[switch]
-            switches = [switch.replace('<path>', path) for switch in switches]
+            if switch in cls._path_switches:
+                switches = [switch.replace('<path>', path) for switch in switches]
+            else:
+                switches = list(switches)  # A copy, so that the class dictionary isn't modified by the caller
             return switches
         else:
             raise ValueError("Invalid switch for class ")
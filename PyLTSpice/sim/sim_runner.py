@@ -427,14 +427,13 @@ class SimRunner(object):
 
     def kill_all_ltspice(self):
         """Function to terminate LTSpice in windows"""
-        simulator = Simulator
-        process_name = simulator.process_name
+        process_name = self.simulator.process_name
         import psutil
-        for proc in psutil.process_iter():
+        # Requesting the attributes upfront lets psutil fetch them in a single pass over each process
+        for proc in psutil.process_iter(['name', 'pid']):
             # check whether the process name matches
-
-            if proc.name() == process_name:
-                _logger.info("killing ngspice", proc.pid)
+            if proc.info['name'] == process_name:
+                _logger.info("killing %s (pid %d)", process_name, proc.info['pid'])
                 proc.kill()
 
     def _maximum_stop_time(self):
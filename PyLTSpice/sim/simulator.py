@@ -23,18 +23,14 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 import subprocess
 
-if sys.version_info.major >= 3 and sys.version_info.minor >= 6:
-    def run_function(command, timeout=None):
-        """Normalizing OS subprocess function calls between different platforms. This function is used for python 3.6
-        and higher versions."""
-        result = subprocess.run(command, timeout=timeout)
-        return result.returncode
-
-else:
-    def run_function(command, timeout=None):
-        """Normalizing OS subprocess function calls between different platforms. This is the old function that was used
-        for python version prior to 3.6"""
-        return subprocess.call(command, timeout=timeout)
+
+def run_function(command, timeout=None):
+    """Normalizing OS subprocess function calls between different platforms.
+    The simulator output is not piped, the process inherits the stdout and stderr of the calling process. This way
+    the output goes directly to the console without being buffered in Python, whatever its size.
+    """
+    result = subprocess.run(command, timeout=timeout)
+    return result.returncode
 
 
 class SpiceSimulatorError(Exception):
@@ -22,6 +22,7 @@ International Support functions
 Not using other known unicode detection libraries because we don't need something so complicated. LTSpice only supports
 for the time being a reduced set of encodings.
 """
+import codecs
 from pathlib import Path
 from typing import Union
 
@@ -45,26 +46,55 @@ def detect_encoding(file_path: Union[str, Path], expected_str: str = '') -> str:
     :return: detected encoding
     :rtype: str
     """
+    # LTSpice normally writes its files in UTF-16 LE, which can be recognized from the first two bytes, either because
+    # of the BOM or because the second byte of an ASCII character is null. In this case there is no need to decode the
+    # whole file with each of the candidate encodings below.
+    with open(file_path, 'rb') as f:
+        head = f.read(2)
+    if head in (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE):
+        encoding = 'utf_16'  # The BOM tells the byte order and is removed by the decoder
+    elif len(head) == 2 and head[0] != 0 and head[1] == 0:
+        encoding = 'utf_16_le'
+    else:
+        encoding = None
+    if encoding is not None:
+        # Only the beginning of the file is decoded, and a character cut at the end of the chunk is left pending in
+        # the decoder, so that a file that is being written or was truncated is still recognized.
+        with open(file_path, 'rb') as f:
+            text = codecs.getincrementaldecoder(encoding)().decode(f.read(4096))
+        if text.startswith(expected_str):
+            return encoding
+
+    # The file is read only once as bytes. The encodings are validated by decoding these bytes, without splitting
+    # the whole file into lines.
+    with open(file_path, 'rb') as f:
+        data = f.read()
     for encoding in ('utf-8', 'utf_16_le', 'cp1252', 'cp1250', 'shift_jis'):
-        try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                lines = f.readlines()
-                f.seek(0)
-        except UnicodeDecodeError:
-            # This encoding didn't work, let's try again
+        if not data:
+            # Empty file
+            continue
+        if encoding == 'utf_16_le' and not expected_str:
+            # Without an expected string, UTF-16 is only recognized from the first two bytes, as done above, since
+            # almost any file with an even number of bytes could be decoded as UTF-16
             continue
+        if encoding == 'utf-8' and data.isascii():
+            # ASCII is a subset of UTF-8, so there is no need to decode the whole file, only its first line
+            first_line = data[:data.find(b'\n') + 1 or len(data)].decode('ascii')
         else:
-            if len(lines) == 0:
-                # Empty file
+            try:
+                text = data.decode(encoding)
+            except UnicodeDecodeError:
+                # This encoding didn't work, let's try again
                 continue
-            if expected_str:
-                if not lines[0].startswith(expected_str):
-                    # File did not start with expected string
-                    # Try again with a different encoding (This is unlikely to resolve the issue)
-                    continue
-            if encoding == 'utf-8' and lines[0][1] == '\x00':
+            first_line = text[:text.find('\n') + 1 or len(text)]
+        if expected_str:
+            if not first_line.startswith(expected_str):
+                # File did not start with expected string
+                # Try again with a different encoding (This is unlikely to resolve the issue)
                 continue
-            return encoding
+        if encoding == 'utf-8' and first_line[1:2] == '\x00':
+            continue
+        return encoding
     else:
         if expected_str:
             raise EncodingDetectError(f"Expected string \"{expected_str}\" not found in file:{file_path}")
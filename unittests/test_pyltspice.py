@@ -36,7 +36,9 @@
 import os  # platform independent paths
 # ------------------------------------------------------------------------------
 # Python Libs
+import codecs  # byte order marks
 import sys  # python path handling
+import tempfile  # files written by the tests
 import unittest  # performs test
 
 #
@@ -44,7 +46,10 @@ import unittest  # performs test
 
 sys.path.append(
     os.path.abspath((os.path.dirname(os.path.abspath(__file__)) + "/../")))  # add project root to lib search path
+from PyLTSpice import LTSteps
 from PyLTSpice.log.ltsteps import LTSpiceLogReader
+from PyLTSpice.log.logfile_data import LogfileData, try_convert_column, try_convert_values
+from PyLTSpice.utils.detect_encoding import detect_encoding, EncodingDetectError
 from PyLTSpice.sim.sim_batch import SimCommander
 from PyLTSpice.raw.raw_read import RawRead
 from PyLTSpice.editor.spice_editor import SpiceEditor
@@ -350,6 +355,97 @@ class test_pyltspice(unittest.TestCase):
 
                 print(log.get_measure_value(measure, step), assert_data[measure][step])
 
+    def test_try_convert_column(self):
+        """try_convert_column() gives the same result as try_convert_values()"""
+        columns = [
+            ['1', '2', '-3'],  # integers stay int
+            ['1', '1e3', '2.5', '-0.0186257', '1.01541e-005'],  # mixed integers and floats
+            ['1.5', '1000000000000000000000000'],  # integer too big for int64
+            ['(-6.02dB,-90°)', '(1.2,45°)'],  # complex values
+            ['1', 'abc', '2.0'],  # text
+            [],
+        ]
+        for column in columns:
+            expected = try_convert_values(column)
+            answer = try_convert_column(column)
+            self.assertEqual([type(value) for value in answer], [type(value) for value in expected], column)
+            self.assertEqual([str(value) for value in answer], [str(value) for value in expected], column)
+        self.assertEqual(try_convert_column(['1', '1e3', '2.5']), [1, 1000.0, 2.5])
+        self.assertIsInstance(try_convert_column(['1', '1e3'])[1], float)
+
+    def test_detect_encoding(self):
+        """detect_encoding() on the encodings written by LTspice"""
+        text = "Circuit: * R=10k\n.step r=1\n"
+        files = {
+            # file contents: (expected encoding, first line read back with it)
+            codecs.BOM_UTF16_LE + text.encode('utf_16_le'): ('utf_16', "Circuit: * R=10k\n"),
+            text.encode('utf_16_le'): ('utf_16_le', "Circuit: * R=10k\n"),
+            text.encode('ascii'): ('utf-8', "Circuit: * R=10k\n"),
+            "Circuit: * T=25°C\n".encode('cp1252'): ('cp1252', "Circuit: * T=25°C\n"),
+            text.encode('utf_16_le')[:-1]: ('utf_16_le', "Circuit: * R=10k\n"),  # truncated while being written
+        }
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, "test.log")
+            for contents, (encoding, first_line) in files.items():
+                with open(filename, 'wb') as f:
+                    f.write(contents)
+                self.assertEqual(detect_encoding(filename, "Circuit:"), encoding, contents)
+                self.assertEqual(detect_encoding(filename), encoding, contents)
+                with open(filename, 'r', encoding=encoding) as f:
+                    self.assertEqual(f.readline(), first_line)
+            with open(filename, 'wb') as f:
+                f.write(b'')
+            self.assertRaises(EncodingDetectError, detect_encoding, filename, "Circuit:")
+
+    def test_export_data_lengths(self):
+        """export_data() with measurements and steps of different lengths"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            export_file = os.path.join(temp_dir, "export.tlog")
+            # More steps than measurements: only the measured steps are exported
+            data = LogfileData(step_set={'r': [1, 2, 3]}, dataset={'vmax': [0.9, 0.8]})
+            with self.assertLogs("PyLTSpice.LTSteps", level='WARNING'):
+                data.export_data(export_file)
+            with open(export_file, 'r') as f:
+                self.assertEqual(f.read(), "step\tr\tvmax\n1\t1\t0.9\n2\t2\t0.8\n")
+            # A measurement shorter than the first one can't be exported
+            data = LogfileData(dataset={'vmax': [0.9, 0.8], 'vmax_FROM': [0]})
+            self.assertRaises(IndexError, data.export_data, export_file)
+
+    def test_ltsteps_short_row(self):
+        """A measurement row with missing values is not silently dropped"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = os.path.join(temp_dir, "short_row.log")
+            with open(log_file, 'w', encoding='utf-8') as f:
+                f.write("Circuit: * short row\n\n.step r1=1\n.step r1=2\n.step r1=3\n\n\n"
+                        "Measurement: vmax\n  step\tMAX(v(out))\tFROM\tTO\n"
+                        "     1\t0.9\t0\t0.001\n     2\t0.8\n     3\t0.7\t0\t0.001\n\n")
+            self.assertRaises(IndexError, LTSpiceLogReader, log_file)
+
+    def test_ltsteps_mout(self):
+        """LTSteps processing of a .mout file, taking the steps from its .log file"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tmout_file = os.path.join(temp_dir, "MEAS - STEP.tmout")
+            LTSteps._process_mout(test_dir + "MEAS - STEP.mout", tmout_file)
+            with open(tmout_file, 'r', encoding='utf_16_le') as f:
+                rows = [line.rstrip('\n').split('\t') for line in f]
+        self.assertEqual(rows[0], ['step', 'vin', 'r1', 'vout_max', 'vout_max_FROM', 'vout_max_TO', 't1', 't1_at'])
+        self.assertEqual([row[:3] for row in rows[1:]],
+                         [['1', '1', '1000'], ['2', '10', '1000'], ['3', '1', '10000'], ['4', '10', '10000']])
+        self.assertEqual([row[3] for row in rows[1:]], ['0.993262', '9.93262', '0.393469', '3.93469'])
+
+    def test_ltsteps_mout_no_steps(self):
+        """LTSteps processing of a .mout file of a simulation without steps"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tmout_file = os.path.join(temp_dir, "MEAS.tmout")
+            LTSteps._process_mout(test_dir + "MEAS.mout", tmout_file)
+            with open(tmout_file, 'r', encoding='utf_16_le') as f:
+                rows = [line.rstrip('\n').split('\t') for line in f]
+        self.assertEqual(rows, [
+            ['step', 'vout_rms', 'vout_rms_FROM', 'vout_rms_TO', 'vin_rms', 'vin_rms_FROM', 'vin_rms_TO', 'gain',
+             'vout1m', 'vout1m_at'],
+            ['1', '1.41109', '0', '0.001', '0.706221', '0', '0.001', '1.99809', '-0.0186257', '0.001'],
+        ])
+
     @unittest.skipIf(False, "Execute All")
     def test_operating_point(self):
         """Operating Point Simulation Test"""